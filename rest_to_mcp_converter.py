@@ -12,16 +12,182 @@ Author: Your Name
 License: MIT
 """
 
+import hashlib
 import os
-import json
-import boto3
-import requests
-import yaml
-from jinja2 import Template
+import tempfile
+import msgspec
+import orjson
 from dotenv import load_dotenv
-import shutil
 from pathlib import Path
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, Callable, Iterator, List, Optional, Tuple, Union
+
+# boto3, yaml and jinja2 are imported where they are used, so the module (and
+# --help) loads without paying for botocore's service model data
+if TYPE_CHECKING:
+    import boto3
+    from jinja2 import Environment, Template
+
+# Shared across converter instances so credentials and endpoints are resolved once
+_SESSION: Optional['boto3.Session'] = None
+
+def _get_session() -> 'boto3.Session':
+    """Get the boto3 session shared by all converter instances."""
+    global _SESSION
+    if _SESSION is None:
+        import boto3
+        _SESSION = boto3.Session()
+    return _SESSION
+
+# Read once at import; mkstemp creates owner-only files, so _atomic_path applies the
+# mode open() would have used
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+@contextmanager
+def _atomic_path(path: Path) -> Iterator[Path]:
+    """
+    Yield a temporary sibling of ``path`` that replaces ``path`` only on success.
+
+    Readers never see a partially written file. If the block raises, the
+    temporary file is removed and ``path`` is left untouched. The file gets the
+    same permissions as one created with ``open(path, 'w')``.
+
+    Args:
+        path (Path): Final destination of the file.
+
+    Yields:
+        Path: Temporary path to write the file to.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+@lru_cache(maxsize=None)
+def _get_jinja_env() -> 'Environment':
+    """
+    Get the Jinja2 environment used to load project templates.
+
+    Templates pre-compiled by ``python -m scripts.precompile_templates`` are
+    loaded from ``templates_compiled`` first. Source templates are the fallback;
+    their compiled code is persisted to a bytecode cache on disk, so warm runs
+    skip lexing and parsing.
+
+    Returns:
+        Environment: Configured Jinja2 environment, shared across converters.
+    """
+    from jinja2 import (
+        ChoiceLoader,
+        Environment,
+        FileSystemBytecodeCache,
+        FileSystemLoader,
+        ModuleLoader
+    )
+    
+    cache_dir = Path('.jinja_cache')
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return Environment(
+        loader=ChoiceLoader([
+            ModuleLoader('templates_compiled'),
+            FileSystemLoader('templates')
+        ]),
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache(str(cache_dir))
+    )
+
+# Tool Claude is forced to call so the MCP configuration comes back as structured JSON
+_MCP_CONFIG_TOOL = {
+    "name": "emit_mcp_config",
+    "description": "Emit the Spring Boot REST controller configuration for the MCP server.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "controller": {
+                "type": "object",
+                "description": "Controller class structure",
+                "properties": {
+                    "class_name": {"type": "string"},
+                    "base_path": {"type": "string"}
+                }
+            },
+            "endpoints": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "path": {"type": "string"},
+                        "method": {
+                            "type": "string",
+                            "enum": ["GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"]
+                        },
+                        "method_name": {"type": "string"},
+                        "request_type": {"type": "string"},
+                        "response_type": {"type": "string"},
+                        "parameters": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "annotation": {
+                                        "type": "string",
+                                        "description": "Spring annotation without '@', e.g. PathVariable"
+                                    },
+                                    "type": {"type": "string"},
+                                    "name": {"type": "string"}
+                                },
+                                "required": ["annotation", "type", "name"]
+                            }
+                        }
+                    },
+                    "required": ["path", "method", "method_name", "response_type", "parameters"]
+                }
+            },
+            "models": {
+                "type": "array",
+                "description": "Request/Response models",
+                "items": {"type": "object"}
+            },
+            "security": {
+                "type": "object",
+                "description": "Security requirements"
+            }
+        },
+        "required": ["endpoints"]
+    }
+}
+
+class RestAnalysis(msgspec.Struct):
+    """
+    Expected shape of the REST endpoint analysis returned by Claude.
+
+    Used to validate the analysis; any additional keys Claude returns are kept in
+    the analysis passed on to the configuration prompt.
+
+    Attributes:
+        methods (List[str]): HTTP methods supported.
+        endpoint (str): Path or URL of the analyzed endpoint.
+        schemas (Dict[str, Any]): Request/Response schemas.
+        path_parameters (Union[List[Any], Dict[str, Any]]): Path parameters.
+        query_parameters (Union[List[Any], Dict[str, Any]]): Query parameters.
+        headers (Union[List[Any], Dict[str, Any]]): Headers.
+        authentication (Any): Authentication requirements.
+    """
+    methods: List[str]
+    endpoint: str
+    schemas: Dict[str, Any] = {}
+    path_parameters: Union[List[Any], Dict[str, Any]] = []
+    query_parameters: Union[List[Any], Dict[str, Any]] = []
+    headers: Union[List[Any], Dict[str, Any]] = []
+    authentication: Any = None
 
 class RestToMcpConverter:
     """
@@ -44,9 +210,19 @@ class RestToMcpConverter:
         """
         load_dotenv()
         self.config = self._load_config(config_path)
-        self.bedrock = boto3.client(
+        self._resolve_project_settings()
+        from botocore.config import Config
+        
+        self.bedrock = _get_session().client(
             service_name='bedrock-runtime',
-            region_name=os.getenv('AWS_REGION', 'us-east-1')
+            region_name=os.getenv('AWS_REGION', 'us-east-1'),
+            config=Config(
+                max_pool_connections=10,
+                retries={'mode': 'adaptive', 'max_attempts': 5},
+                tcp_keepalive=True,
+                connect_timeout=3,
+                read_timeout=60
+            )
         )
         
     def _load_config(self, config_path: str) -> Dict[str, Any]:
@@ -63,37 +239,174 @@ class RestToMcpConverter:
             FileNotFoundError: If the configuration file doesn't exist.
             yaml.YAMLError: If the configuration file is invalid.
         """
+        import yaml
+        
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader
+        
         with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=SafeLoader)
+    
+    def _resolve_project_settings(self) -> None:
+        """
+        Resolve the project settings used during generation into attributes.
+
+        Raises:
+            ValueError: If a required setting is missing or has the wrong type.
+        """
+        try:
+            project = self.config['project']
+            self._pkg = project['package']
+            self._project_name = project['name']
+            self._version = project['version']
+            self._port = self.config['server']['port']
+        except (KeyError, TypeError) as e:
+            raise ValueError(f'Missing required configuration setting: {e}') from e
+        
+        for setting, value in (('project.package', self._pkg), ('project.name', self._project_name)):
+            if not isinstance(value, str):
+                raise ValueError(f'Configuration setting {setting} must be a string')
+        if isinstance(self._version, bool) or not isinstance(self._version, (str, int, float)):
+            raise ValueError('Configuration setting project.version must be a string')
+        if isinstance(self._port, bool) or not isinstance(self._port, int):
+            raise ValueError('Configuration setting server.port must be an integer')
+        
+        self._version = str(self._version)
+        self._pkg_path = self._pkg.replace('.', '/')
     
-    def _call_claude(self, prompt: str) -> str:
+    def _response_cache_path(self, model_id: str, request_body: bytes) -> Optional[Path]:
         """
-        Call Claude model via AWS Bedrock.
+        Get the on-disk cache entry for a Claude request.
+
+        Args:
+            model_id (str): Bedrock model the request is sent to.
+            request_body (bytes): Serialized request body.
+
+        Returns:
+            Optional[Path]: Path of the cache entry, or None if caching is disabled.
+        """
+        cache_config = self.config.get('cache', {})
+        if not cache_config.get('enabled', True):
+            return None
+        
+        key = hashlib.sha256(model_id.encode() + b'\0' + request_body).hexdigest()
+        return Path(cache_config.get('directory', '.claude_cache')) / f'{key}.json'
+    
+    def _call_claude(
+        self,
+        system_prefix: str,
+        user_payload: str,
+        use_cache: bool = True,
+        tool: Optional[Dict[str, Any]] = None,
+        max_tokens: int = 1024,
+        stop: Optional[List[str]] = None,
+        parse: Optional[Callable[[Union[str, Dict[str, Any]]], Any]] = None
+    ) -> Any:
+        """
+        Call Claude model via AWS Bedrock, streaming the response.
+
+        The invariant instructions are sent first and, when ``bedrock.prompt_caching``
+        is enabled, marked for prompt caching so repeated calls only pay for the
+        variable payload that follows them. Responses
+        are also cached on disk by request, so identical requests skip Bedrock. A
+        response is only cached once ``parse`` accepts it.
 
         Args:
-            prompt (str): The prompt to send to Claude.
+            system_prefix (str): Invariant instructions sent as the cached prompt prefix.
+            user_payload (str): Variable content appended after the prefix.
+            use_cache (bool): Whether the response may be served from and stored in
+                the response cache. Only read-only prompts should be cached.
+            tool (Optional[Dict[str, Any]]): Tool definition Claude is forced to call.
+                When given, the tool input is returned instead of text.
+            max_tokens (int): Maximum number of tokens Claude may generate.
+            stop (Optional[List[str]]): Sequences that end generation early. The
+                built-in prompts don't use it; it is for callers that need it.
+            parse (Optional[Callable]): Parses and validates the response. Responses
+                it rejects are not cached.
 
         Returns:
-            str: Claude's response.
+            Any: Claude's text response, or the tool input if a tool was given,
+                passed through ``parse`` when given.
 
         Raises:
+            RuntimeError: If the response was truncated at ``max_tokens``.
             Exception: If the API call fails.
         """
-        model_id = 'anthropic.claude-3-sonnet-20240229-v1:0'
+        bedrock_config = self.config.get('bedrock', {})
+        model_id = bedrock_config.get('model_id', 'anthropic.claude-3-sonnet-20240229-v1:0')
+        
+        prefix_block = {"type": "text", "text": system_prefix}
+        if bedrock_config.get('prompt_caching', False):
+            prefix_block["cache_control"] = {"type": "ephemeral"}
         
         body = {
             "anthropic_version": "bedrock-2023-05-31",
-            "max_tokens": 4096,
-            "messages": [{"role": "user", "content": prompt}]
+            "max_tokens": max_tokens,
+            "messages": [{
+                "role": "user",
+                "content": [
+                    prefix_block,
+                    {"type": "text", "text": user_payload}
+                ]
+            }]
         }
+        if stop:
+            body["stop_sequences"] = stop
+        if tool is not None:
+            body["tools"] = [tool]
+            body["tool_choice"] = {"type": "tool", "name": tool["name"]}
+        
+        request_body = orjson.dumps(body)
+        
+        cache_path = self._response_cache_path(model_id, request_body) if use_cache else None
+        if cache_path is not None and cache_path.exists():
+            try:
+                cached = orjson.loads(cache_path.read_bytes())
+                return parse(cached) if parse else cached
+            except Exception:
+                # Entries that can't be read or no longer parse are treated as misses
+                pass
         
-        response = self.bedrock.invoke_model(
+        invoke_kwargs = {}
+        if bedrock_config.get('latency_optimized', False):
+            invoke_kwargs['performanceConfigLatency'] = 'optimized'
+        
+        response = self.bedrock.invoke_model_with_response_stream(
             modelId=model_id,
-            body=json.dumps(body)
+            body=request_body,
+            **invoke_kwargs
         )
         
-        response_body = json.loads(response['body'].read())
-        return response_body['content'][0]['text']
+        # Collect text (or tool input JSON) deltas as they arrive instead of waiting
+        # for the full body
+        delta_type, delta_field = ('input_json_delta', 'partial_json') if tool else ('text_delta', 'text')
+        chunks = []
+        stop_reason = None
+        for event in response['body']:
+            chunk = orjson.loads(event['chunk']['bytes'])
+            if chunk['type'] == 'content_block_delta' and chunk['delta']['type'] == delta_type:
+                chunks.append(chunk['delta'][delta_field])
+            elif chunk['type'] == 'message_delta':
+                stop_reason = chunk['delta'].get('stop_reason', stop_reason)
+        
+        if stop_reason == 'max_tokens':
+            raise RuntimeError(
+                f'Claude response was truncated after max_tokens={max_tokens}; '
+                'the endpoint may be too large for a single request'
+            )
+        result = ''.join(chunks)
+        if tool is not None:
+            result = orjson.loads(result)
+        parsed = parse(result) if parse else result
+        
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with _atomic_path(cache_path) as tmp_path:
+                tmp_path.write_bytes(orjson.dumps(result))
+        
+        return parsed
     
     def analyze_rest_endpoint(self, rest_endpoint: str) -> Dict[str, Any]:
         """
@@ -107,11 +420,11 @@ class RestToMcpConverter:
                            schemas, parameters, and authentication requirements.
 
         Raises:
+            msgspec.ValidationError: If Claude's response doesn't match RestAnalysis.
             Exception: If the analysis fails.
         """
-        prompt = f"""
-        Analyze this REST endpoint and provide a detailed JSON structure:
-        {rest_endpoint}
+        system_prefix = """
+        Analyze the REST endpoint that follows and provide a detailed JSON structure.
         
         Include:
         1. HTTP methods supported
@@ -121,11 +434,22 @@ class RestToMcpConverter:
         5. Headers
         6. Authentication requirements
         
-        Format the response as a valid JSON object.
+        Format the response as a valid JSON object with the keys "methods" (array of
+        strings), "endpoint" (path or URL), "schemas" (object), "path_parameters",
+        "query_parameters", "headers" and "authentication". Add any other relevant
+        details, such as the base URL, status codes or descriptions, as extra keys.
+        
+        REST endpoint:
         """
         
-        analysis = self._call_claude(prompt)
-        return json.loads(analysis)
+        def parse(analysis: str) -> Dict[str, Any]:
+            payload = msgspec.json.decode(analysis, type=Dict[str, Any])
+            payload.setdefault('endpoint', rest_endpoint)
+            # Validate the shape but keep the full payload, including extra keys
+            msgspec.convert(payload, RestAnalysis)
+            return payload
+        
+        return self._call_claude(system_prefix, rest_endpoint, max_tokens=1024, parse=parse)
     
     def generate_mcp_config(self, rest_analysis: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -136,14 +460,14 @@ class RestToMcpConverter:
 
         Returns:
             Dict[str, Any]: MCP configuration including controller structure,
-                           request mappings, and security requirements.
+                           request mappings, and security requirements, plus the
+                           service, tracing and logging settings from config.yaml.
 
         Raises:
             Exception: If the configuration generation fails.
         """
-        prompt = f"""
-        Convert this REST API analysis into a Spring Boot REST controller configuration:
-        {json.dumps(rest_analysis, indent=2)}
+        system_prefix = """
+        Convert the REST API analysis that follows into a Spring Boot REST controller configuration.
         
         Include:
         1. Controller class structure
@@ -152,16 +476,34 @@ class RestToMcpConverter:
         4. Request/Response models
         5. Security requirements
         
-        Format the response as a valid YAML configuration.
+        Return the configuration by calling the emit_mcp_config tool.
+        
+        REST API analysis:
         """
         
-        mcp_config = self._call_claude(prompt)
-        return yaml.safe_load(mcp_config)
+        mcp_config = self._call_claude(
+            system_prefix,
+            msgspec.json.encode(rest_analysis).decode(),
+            tool=_MCP_CONFIG_TOOL,
+            max_tokens=2048
+        )
+        
+        # The service, tracing and logging settings rendered into application.yml
+        # come from our own configuration rather than from Claude
+        mcp_settings = self.config.get('mcp', {})
+        for key in ('service', 'tracing', 'logging'):
+            if key in mcp_settings:
+                mcp_config.setdefault(key, mcp_settings[key])
+        
+        return mcp_config
     
     def generate_spring_boot_project(self, mcp_config: Dict[str, Any], output_path: str) -> None:
         """
         Generate a Spring Boot project with MCP configuration.
 
+        The project files are independent of each other, so they are rendered and
+        written concurrently on a thread pool.
+
         Args:
             mcp_config (Dict[str, Any]): MCP configuration.
             output_path (str): Path where the project should be generated.
@@ -171,56 +513,74 @@ class RestToMcpConverter:
         """
         # Create project structure
         project_path = Path(output_path)
-        project_path.mkdir(parents=True, exist_ok=True)
-        
-        # Generate pom.xml
-        pom_template = self._load_template('templates/pom.xml.j2')
-        pom_content = pom_template.render(
-            project_name=self.config['project']['name'],
-            version=self.config['project']['version']
-        )
-        
-        with open(project_path / 'pom.xml', 'w') as f:
-            f.write(pom_content)
-        
-        # Generate application.yml
-        app_config_template = self._load_template('templates/application.yml.j2')
-        app_config_content = app_config_template.render(
-            mcp_config=mcp_config,
-            server_port=self.config['server']['port']
-        )
-        
         config_path = project_path / 'src/main/resources'
-        config_path.mkdir(parents=True, exist_ok=True)
-        
-        with open(config_path / 'application.yml', 'w') as f:
-            f.write(app_config_content)
-        
-        # Generate main application class
-        main_class_template = self._load_template('templates/MainApplication.java.j2')
-        main_class_content = main_class_template.render(
-            package_name=self.config['project']['package']
-        )
-        
-        java_path = project_path / f"src/main/java/{self.config['project']['package'].replace('.', '/')}"
+        java_path = project_path / f'src/main/java/{self._pkg_path}'
+        # The deep Java path also creates the project root and src/main
         java_path.mkdir(parents=True, exist_ok=True)
+        config_path.mkdir(exist_ok=True)
         
-        with open(java_path / 'MainApplication.java', 'w') as f:
-            f.write(main_class_content)
-        
-        # Generate REST controller
-        controller_template = self._load_template('templates/RestController.java.j2')
-        controller_content = controller_template.render(
-            package_name=self.config['project']['package'],
-            endpoints=mcp_config['endpoints']
-        )
-        
-        with open(java_path / 'RestController.java', 'w') as f:
-            f.write(controller_content)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                # Generate pom.xml
+                executor.submit(
+                    self._write_template,
+                    project_path / 'pom.xml',
+                    'templates/pom.xml.j2',
+                    project_name=self._project_name,
+                    version=self._version
+                ),
+                # Generate application.yml
+                executor.submit(
+                    self._write_template,
+                    config_path / 'application.yml',
+                    'templates/application.yml.j2',
+                    mcp_config=mcp_config,
+                    server_port=self._port
+                ),
+                # Generate main application class
+                executor.submit(
+                    self._write_template,
+                    java_path / 'MainApplication.java',
+                    'templates/MainApplication.java.j2',
+                    package_name=self._pkg
+                ),
+                # Generate REST controller
+                executor.submit(
+                    self._write_template,
+                    java_path / 'RestController.java',
+                    'templates/RestController.java.j2',
+                    package_name=self._pkg,
+                    endpoints=mcp_config['endpoints']
+                )
+            ]
+            # Surface the first failure, if any
+            for future in futures:
+                future.result()
+    
+    def _write_template(self, path: Path, template_path: str, **context: Any) -> None:
+        """
+        Render a template and write it to a file.
+
+        The output is streamed to a temporary file that replaces ``path`` only once
+        rendering succeeds, so a render error never leaves a truncated file behind.
+
+        Args:
+            path (Path): Destination file.
+            template_path (str): Path to the template file.
+            **context: Variables passed to the template.
+        """
+        # Stream the output so large templates are not materialized as one string
+        with _atomic_path(path) as tmp_path:
+            self._load_template(template_path).stream(**context).dump(str(tmp_path), encoding='utf-8')
     
-    def _load_template(self, template_path: str) -> Template:
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _load_template(template_path: str) -> 'Template':
         """
-        Load a Jinja2 template from file.
+        Load a Jinja2 template from the templates directory.
+
+        Templates are loaded at most once per process; ``Template`` objects are
+        safe to render concurrently, so they are shared across conversions.
 
         Args:
             template_path (str): Path to the template file.
@@ -229,10 +589,9 @@ class RestToMcpConverter:
             Template: Loaded Jinja2 template.
 
         Raises:
-            FileNotFoundError: If the template file doesn't exist.
+            jinja2.TemplateNotFound: If the template file doesn't exist.
         """
-        with open(template_path, 'r') as f:
-            return Template(f.read())
+        return _get_jinja_env().get_template(template_path.split('/')[-1])
     
     def convert(self, rest_endpoint: str, output_path: str) -> Dict[str, Any]:
         """
@@ -270,6 +629,25 @@ class RestToMcpConverter:
                 'message': str(e)
             }
 
+    def convert_many(self, pairs: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Convert several REST endpoints to MCP servers concurrently.
+
+        Each conversion is I/O-bound on Bedrock, so the conversions run on a thread
+        pool and their network round-trips overlap.
+
+        Args:
+            pairs (List[Tuple[str, str]]): (rest_endpoint, output_path) pairs.
+
+        Returns:
+            List[Dict[str, Any]]: Result of each conversion, in the order of ``pairs``.
+        """
+        if not pairs:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(pairs))) as executor:
+            return list(executor.map(lambda pair: self.convert(*pair), pairs))
+
 def main():
     """Main entry point for the converter."""
     import argparse
@@ -284,7 +662,7 @@ def main():
     converter = RestToMcpConverter(args.config)
     result = converter.convert(args.rest_endpoint, args.output_path)
     
-    print(json.dumps(result, indent=2))
+    print(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode())
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
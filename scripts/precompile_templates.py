@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Pre-compile the Jinja2 project templates.
+
+Compiles every template in ``templates/`` into Python modules under
+``templates_compiled/``, which the converter loads before falling back to the
+source templates. Run from the repository root:
+
+    python -m scripts.precompile_templates
+"""
+
+from jinja2 import Environment, FileSystemLoader
+
+TEMPLATES_DIR = 'templates'
+COMPILED_DIR = 'templates_compiled'
+
+
+def main():
+    """Compile all templates into the compiled templates directory."""
+    env = Environment(loader=FileSystemLoader(TEMPLATES_DIR))
+    env.compile_templates(COMPILED_DIR, zip=None, ignore_errors=False, log_function=print)
+
+
+if __name__ == '__main__':
+    main()
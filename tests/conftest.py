@@ -0,0 +1,40 @@
+"""Shared fixtures for the converter tests."""
+
+from pathlib import Path
+
+import orjson
+import pytest
+
+from rest_to_mcp_converter import RestToMcpConverter
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+class FakeBedrock:
+    """Bedrock runtime client that streams pre-recorded Anthropic events."""
+
+    def __init__(self, events):
+        self.events = events
+        self.requests = []
+
+    def invoke_model_with_response_stream(self, **kwargs):
+        self.requests.append(kwargs)
+        return {'body': [{'chunk': {'bytes': orjson.dumps(event)}} for event in self.events]}
+
+
+@pytest.fixture
+def converter(monkeypatch):
+    """Converter using the repository config and templates, with caching disabled."""
+    monkeypatch.chdir(REPO_ROOT)
+    converter = RestToMcpConverter('config.yaml')
+    converter.config['cache'] = {'enabled': False}
+    return converter
+
+
+@pytest.fixture
+def fake_bedrock(converter):
+    """Install a FakeBedrock on ``converter`` that streams the given events."""
+    def install(*events):
+        converter.bedrock = FakeBedrock(list(events))
+        return converter.bedrock
+    return install
@@ -0,0 +1,36 @@
+"""Tests for validating the REST endpoint analysis returned by Claude."""
+
+import msgspec
+import pytest
+
+
+@pytest.fixture
+def stub_converter(converter, monkeypatch):
+    """Converter whose Claude call returns the text stored in ``converter.response``."""
+    monkeypatch.setattr(
+        converter,
+        '_call_claude',
+        lambda system_prefix, user_payload, parse, **kwargs: parse(converter.response)
+    )
+    return converter
+
+
+def test_analysis_keeps_extra_keys_and_object_headers(stub_converter):
+    stub_converter.response = (
+        '{"methods": ["GET"], "headers": {"Authorization": "Bearer"},'
+        ' "base_url": "https://api.example.com", "status_codes": [200, 404]}'
+    )
+    
+    analysis = stub_converter.analyze_rest_endpoint('https://api.example.com/v1/users')
+    
+    assert analysis['endpoint'] == 'https://api.example.com/v1/users'
+    assert analysis['headers'] == {'Authorization': 'Bearer'}
+    assert analysis['base_url'] == 'https://api.example.com'
+    assert analysis['status_codes'] == [200, 404]
+
+
+def test_analysis_requires_methods(stub_converter):
+    stub_converter.response = '{}'
+    
+    with pytest.raises(msgspec.ValidationError):
+        stub_converter.analyze_rest_endpoint('https://api.example.com/v1/users')
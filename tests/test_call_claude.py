@@ -0,0 +1,73 @@
+"""Tests for streaming Claude responses from Bedrock in _call_claude."""
+
+import orjson
+import pytest
+
+from rest_to_mcp_converter import _MCP_CONFIG_TOOL
+
+
+def delta(delta_type, field, value):
+    return {'type': 'content_block_delta', 'index': 0, 'delta': {'type': delta_type, field: value}}
+
+
+def stop(reason):
+    return {'type': 'message_delta', 'delta': {'stop_reason': reason}}
+
+
+def test_forced_tool_call_returns_parsed_tool_input(converter, fake_bedrock):
+    client = fake_bedrock(
+        {'type': 'message_start'},
+        delta('input_json_delta', 'partial_json', '{"endpoints": [{"path": '),
+        delta('input_json_delta', 'partial_json', '"/users"}]}'),
+        stop('tool_use'),
+        {'type': 'message_stop'}
+    )
+    
+    result = converter._call_claude('Instructions', 'Payload', tool=_MCP_CONFIG_TOOL)
+    
+    body = orjson.loads(client.requests[0]['body'])
+    assert body['tools'] == [_MCP_CONFIG_TOOL]
+    assert body['tool_choice'] == {'type': 'tool', 'name': 'emit_mcp_config'}
+    assert result == {'endpoints': [{'path': '/users'}]}
+
+
+def test_truncated_response_raises_and_is_not_cached(converter, fake_bedrock, tmp_path):
+    converter.config['cache'] = {'directory': str(tmp_path)}
+    fake_bedrock(
+        delta('text_delta', 'text', '{"methods": ['),
+        stop('max_tokens')
+    )
+    
+    with pytest.raises(RuntimeError, match='max_tokens=16'):
+        converter._call_claude('Instructions', 'Payload', max_tokens=16)
+    
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_stop_sequences_are_sent(converter, fake_bedrock):
+    client = fake_bedrock(delta('text_delta', 'text', 'done'), stop('stop_sequence'))
+    
+    assert converter._call_claude('Instructions', 'Payload', stop=['END']) == 'done'
+    assert orjson.loads(client.requests[0]['body'])['stop_sequences'] == ['END']
+
+
+def test_rejected_response_is_not_cached(converter, fake_bedrock, tmp_path):
+    converter.config['cache'] = {'directory': str(tmp_path)}
+    fake_bedrock(delta('text_delta', 'text', 'Here is the JSON: {}'), stop('end_turn'))
+    
+    with pytest.raises(orjson.JSONDecodeError):
+        converter._call_claude('Instructions', 'Payload', parse=orjson.loads)
+    
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_identical_request_is_served_from_cache(converter, fake_bedrock, tmp_path):
+    converter.config['cache'] = {'directory': str(tmp_path)}
+    client = fake_bedrock(delta('text_delta', 'text', '{"methods": ["GET"]}'), stop('end_turn'))
+    
+    first = converter._call_claude('Instructions', 'Payload', parse=orjson.loads)
+    second = converter._call_claude('Instructions', 'Payload', parse=orjson.loads)
+    
+    assert first == second == {'methods': ['GET']}
+    assert len(client.requests) == 1
+    assert len(list(tmp_path.iterdir())) == 1
@@ -0,0 +1,56 @@
+"""Tests for rendering a Spring Boot project from a generated MCP configuration."""
+
+import stat
+
+# Minimal tool input that satisfies _MCP_CONFIG_TOOL's input schema
+TOOL_INPUT = {
+    "endpoints": [
+        {
+            "path": "/users/{id}",
+            "method": "GET",
+            "method_name": "getUser",
+            "response_type": "User",
+            "parameters": [
+                {"annotation": "PathVariable", "type": "String", "name": "id"}
+            ]
+        }
+    ]
+}
+
+
+def test_generate_project_from_schema_conforming_config(converter, monkeypatch, tmp_path):
+    monkeypatch.setattr(converter, '_call_claude', lambda *args, **kwargs: dict(TOOL_INPUT))
+    
+    mcp_config = converter.generate_mcp_config({'methods': ['GET'], 'endpoint': '/users/{id}'})
+    converter.generate_spring_boot_project(mcp_config, str(tmp_path))
+    
+    java_path = tmp_path / 'src/main/java/com/example/mcp'
+    pom = (tmp_path / 'pom.xml').read_text(encoding='utf-8')
+    app_config = (tmp_path / 'src/main/resources/application.yml').read_text(encoding='utf-8')
+    main_class = (java_path / 'MainApplication.java').read_text(encoding='utf-8')
+    controller = (java_path / 'RestController.java').read_text(encoding='utf-8')
+    
+    assert '<artifactId>mcp-server</artifactId>' in pom
+    assert 'name: mcp-service' in app_config
+    assert 'root: INFO' in app_config
+    assert 'package com.example.mcp;' in main_class
+    assert 'public ResponseEntity<User> getUser(' in controller
+    assert '@PathVariable String id' in controller
+
+
+def test_generated_files_have_default_permissions(converter, tmp_path):
+    converter.generate_spring_boot_project(
+        {'endpoints': TOOL_INPUT['endpoints'], **converter.config['mcp']},
+        str(tmp_path / 'project')
+    )
+    
+    # A file created the way the project files used to be written
+    reference = tmp_path / 'reference.txt'
+    with open(reference, 'w') as f:
+        f.write('')
+    
+    expected_mode = stat.S_IMODE(reference.stat().st_mode)
+    for name in ('pom.xml', 'src/main/resources/application.yml',
+                 'src/main/java/com/example/mcp/MainApplication.java',
+                 'src/main/java/com/example/mcp/RestController.java'):
+        assert stat.S_IMODE((tmp_path / 'project' / name).stat().st_mode) == expected_mode